@@ -4,7 +4,6 @@
 import argparse
 import numpy as np
 import time
-import pylab as plt
 import scipy.cluster.vq as vq
 from scipy.spatial import distance
 
@@ -70,6 +69,7 @@ class XMeans:
 
             #print "Estimated K: ", curr_K
             if self.plot:
+                import matplotlib.pyplot as plt
                 plt.scatter(self.X[:, 0], self.X[:, 1])
                 plt.scatter(final_means[:, 0], final_means[:, 1], color="y")
                 plt.show()
@@ -120,6 +120,7 @@ class XMeans:
 
         #print "Estimated K: ", finalK
         if self.plot:
+            import matplotlib.pyplot as plt
             plt.subplot(2, 1, 1)
             plt.plot(K, bics, label="BIC")
             plt.plot(K[:-1], diff_bics, label="BIC diff")
@@ -201,6 +202,7 @@ def test_kmeans(K=5):
     wX = vq.whiten(X)
     dic, dist = vq.kmeans(wX, K, iter=100)
 
+    import matplotlib.pyplot as plt
     plt.scatter(wX[:, 0], wX[:, 1])
     plt.scatter(dic[:, 0], dic[:, 1], color="m")
     plt.show()
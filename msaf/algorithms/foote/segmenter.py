@@ -5,7 +5,6 @@ import logging
 import numpy as np
 from scipy.spatial import distance
 from scipy import signal, ndimage
-import pylab as plt
 
 import msaf
 from msaf.algorithms.interface import SegmenterInterface
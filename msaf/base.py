@@ -171,6 +171,49 @@ class Features(six.with_metaclass(MetaFeatures)):
                                                 hop_length=self.hop_length)
         return times, frames
 
+    def read_cached_beats(self, tol=1e-3):
+        """Reads the beats stored in the features file, as long as they were
+        computed from the same audio file with the same global parameters
+        (and, for the annotated beats, from the same reference file).
+
+        Parameters
+        ----------
+        tol: float
+            Tolerance level to detect duration of audio.
+
+        Returns
+        -------
+        est_times: np.array
+            Times of estimated beats in seconds.
+            `None` if they couldn't be found.
+        ann_times: np.array
+            Times of annotated beats in seconds.
+            `None` if they couldn't be found.
+        """
+        if self.dur is None:
+            return None, None
+        try:
+            feats = msaf.io.read_features_file(self.file_struct.features_file)
+            globals_ = feats["globals"]
+            if not np.isclose(self.dur, float(globals_["dur"]), rtol=tol) or \
+                    self.sr != int(globals_["sample_rate"]) or \
+                    self.hop_length != int(globals_["hop_length"]) or \
+                    os.path.basename(self.file_struct.audio_file) != \
+                    os.path.basename(globals_["audio_file"]):
+                return None, None
+            est_times = np.array(feats["est_beats"])
+        except (IOError, KeyError, ValueError):
+            return None, None
+
+        # Annotated beats are only valid for the same reference file
+        ann_times = None
+        ref_file = self.file_struct.ref_file
+        if "ann_beats" in feats.keys() and os.path.isfile(ref_file) and \
+                os.path.normpath(ref_file) == \
+                os.path.normpath(globals_.get("ref_file", "")):
+            ann_times = np.array(feats["ann_beats"])
+        return est_times, ann_times
+
     def compute_beat_sync_features(self, beat_frames, beat_times, pad):
         """Make the features beat-synchronous.
 
@@ -217,8 +260,7 @@ class Features(six.with_metaclass(MetaFeatures)):
         """
         try:
             # Read JSON file
-            with open(self.file_struct.features_file) as f:
-                feats = json.load(f)
+            feats = msaf.io.read_features_file(self.file_struct.features_file)
 
             # Store duration
             if self.dur is None:
@@ -303,7 +345,8 @@ class Features(six.with_metaclass(MetaFeatures)):
                 "dur": self.dur,
                 "sample_rate": self.sr,
                 "hop_length": self.hop_length,
-                "audio_file": self.file_struct.audio_file
+                "audio_file": self.file_struct.audio_file,
+                "ref_file": self.file_struct.ref_file
             }
 
             # Beats
@@ -331,16 +374,24 @@ class Features(six.with_metaclass(MetaFeatures)):
 
             # Actual features
             out_json[self.get_id()]["framesync"] = \
-                self._framesync_features.tolist()
+                self._features_to_list(self._framesync_features)
             out_json[self.get_id()]["est_beatsync"] = \
-                self._est_beatsync_features.tolist()
+                self._features_to_list(self._est_beatsync_features)
             if self._ann_beatsync_features is not None:
                 out_json[self.get_id()]["ann_beatsync"] = \
-                    self._ann_beatsync_features.tolist()
+                    self._features_to_list(self._ann_beatsync_features)
 
-            # Save it
+            # Save it (compactly, since these files can get large)
             with open(self.file_struct.features_file, "w") as f:
-                json.dump(out_json, f, indent=2)
+                json.dump(out_json, f, separators=(",", ":"))
+
+    def _features_to_list(self, features):
+        """Converts the given features into a list to be stored in the
+        features file, rounding them to `config.features_decimals` decimals
+        if set."""
+        if msaf.config.features_decimals is not None:
+            features = np.round(features, msaf.config.features_decimals)
+        return features.tolist()
 
     def get_param_names(self):
         """Returns the parameter names for these features, avoiding
@@ -372,9 +423,24 @@ class Features(six.with_metaclass(MetaFeatures)):
         # Compute framesync times
         self._compute_framesync_times()
 
-        # Compute/Read beats
-        self._est_beats_times, self._est_beats_frames = self.estimate_beats()
-        self._ann_beats_times, self._ann_beats_frames = self.read_ann_beats()
+        # Compute/Read beats, unless they are already in the features file
+        est_beats_times, ann_beats_times = self.read_cached_beats()
+        if est_beats_times is None:
+            self._est_beats_times, self._est_beats_frames = \
+                self.estimate_beats()
+        else:
+            # Estimated beats fall exactly on frames, so round (instead of
+            # flooring) to recover the frames `estimate_beats` found
+            self._est_beats_times = est_beats_times
+            self._est_beats_frames = np.round(
+                est_beats_times * self.sr / self.hop_length).astype(int)
+        if ann_beats_times is None:
+            self._ann_beats_times, self._ann_beats_frames = \
+                self.read_ann_beats()
+        else:
+            self._ann_beats_times = ann_beats_times
+            self._ann_beats_frames = librosa.core.time_to_frames(
+                ann_beats_times, sr=self.sr, hop_length=self.hop_length)
 
         # Beat-Synchronize
         pad = True  # Always append to the end of the features
@@ -393,7 +459,11 @@ class Features(six.with_metaclass(MetaFeatures)):
         # Make sure we have already computed the features
         self.features
         if self.feat_type is FeatureTypes.framesync:
-            self._compute_framesync_times()
+            # Only compute them if they are missing or outdated
+            if self._framesync_times is None or \
+                    self._framesync_times.shape[0] != \
+                    self._framesync_features.shape[0]:
+                self._compute_framesync_times()
             frame_times = self._framesync_times
         elif self.feat_type is FeatureTypes.est_beatsync:
             frame_times = self._est_beatsync_times
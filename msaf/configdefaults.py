@@ -34,6 +34,11 @@ AddConfigVar('minimum_frames', "Minimum number of frames to activate "
              "algorithms.", IntParam(10))
 AddConfigVar('features_tmp_file', "Default temporary file for features.",
              StrParam(".features_msaf_tmp.json"))
+AddConfigVar('features_decimals', "Number of decimals to round the features "
+             "to when storing them (None to keep full precision).",
+             IntParam(None))
+AddConfigVar('features_cache_size', "Maximum number of parsed features "
+             "files kept in memory (0 to disable).", IntParam(1))
 
 # Dataset files and dirs
 AddConfigVar('dataset.audio_dir', "Default audio directory.",
@@ -8,7 +8,7 @@ import json
 import logging
 import os
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 import jams
 import numpy as np
@@ -22,6 +22,9 @@ from msaf.exceptions import NoEstimationsError
 # Put dataset config in a global var
 ds_config = msaf.config.dataset
 
+# Parsed features files, indexed by path, mtime, and size
+_features_cache = OrderedDict()
+
 
 class FileStruct:
     def __init__(self, audio_file):
@@ -146,15 +149,16 @@ def align_times(times, frames):
     times: np.ndarray
         Times in seconds to be aligned.
     frames: np.ndarray
-        Frame times in seconds.
+        Frame times in seconds, sorted in ascending order.
 
     Returns
     -------
     aligned_times: np.ndarray
         Aligned times.
     """
-    dist = np.minimum.outer(times, frames)
-    bound_frames = np.argmax(np.maximum(0, dist), axis=1)
+    # Index of the first frame at or after each time (or the last frame)
+    bound_frames = np.minimum(np.searchsorted(frames, times),
+                              len(frames) - 1)
     aligned_times = np.unique(bound_frames)
     return aligned_times
 
@@ -314,7 +318,7 @@ def get_all_boundary_algorithms():
     """
     algo_ids = []
     for name in msaf.algorithms.__all__:
-        module = eval(msaf.algorithms.__name__ + "." + name)
+        module = getattr(msaf.algorithms, name)
         if module.is_boundary_type:
             algo_ids.append(module.algo_id)
     return algo_ids
@@ -330,7 +334,7 @@ def get_all_label_algorithms():
     """
     algo_ids = []
     for name in msaf.algorithms.__all__:
-        module = eval(msaf.algorithms.__name__ + "." + name)
+        module = getattr(msaf.algorithms, name)
         if module.is_label_type:
             algo_ids.append(module.algo_id)
     return algo_ids
@@ -346,12 +350,10 @@ def get_configuration(feature, annot_beats, framesync, boundaries_id,
     config["framesync"] = framesync
     bound_config = {}
     if boundaries_id != "gt":
-        bound_config = \
-            eval(msaf.algorithms.__name__ + "." + boundaries_id).config
+        bound_config = getattr(msaf.algorithms, boundaries_id).config
         config.update(bound_config)
     if labels_id is not None:
-        label_config = \
-            eval(msaf.algorithms.__name__ + "." + labels_id).config
+        label_config = getattr(msaf.algorithms, labels_id).config
 
         # Make sure we don't have parameter name duplicates
         if labels_id != boundaries_id:
@@ -435,6 +437,44 @@ def read_hier_references(jams_file, annotation_id=0, exclude_levels=[]):
     return hier_bounds, hier_labels, hier_levels
 
 
+def read_features_file(features_file):
+    """Reads the contents of a features file, reusing the previously parsed
+    contents if the file has not been modified since the last read.
+
+    The returned dictionary is shared among callers, so it should not be
+    modified.
+
+    Parameters
+    ----------
+    features_file: str
+        Path to the JSON file containing the features.
+
+    Returns
+    -------
+    feats: dict
+        Parsed contents of the features file.
+
+    Raises
+    ------
+    IOError: if `features_file` doesn't exist.
+    """
+    stat = os.stat(features_file)
+    key = (os.path.abspath(features_file), stat.st_mtime_ns, stat.st_size)
+    feats = _features_cache.get(key)
+    if feats is not None:
+        return feats
+
+    with open(features_file) as f:
+        feats = json.load(f)
+
+    # Keep only the most recently read files in memory
+    if msaf.config.features_cache_size > 0:
+        _features_cache[key] = feats
+        while len(_features_cache) > msaf.config.features_cache_size:
+            _features_cache.popitem(last=False)
+    return feats
+
+
 def get_duration(features_file):
     """Reads the duration of a given features file.
 
@@ -448,8 +488,7 @@ def get_duration(features_file):
     dur: float
         Duration of the analyzed file.
     """
-    with open(features_file) as f:
-        feats = json.load(f)
+    feats = read_features_file(features_file)
     return float(feats["globals"]["dur"])
 
 
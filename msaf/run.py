@@ -1,7 +1,7 @@
 """
 This module contains multiple functions in order to run MSAF algorithms.
 """
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from joblib import Parallel, delayed
 import librosa
 import logging
@@ -16,6 +16,10 @@ from msaf.features import Features
 from msaf.exceptions import NoHierBoundaryError, NoAudioFileError
 import msaf.algorithms as algorithms
 
+# All the algorithm modules, indexed by their identifier
+_ALGO_MODULES = {name: getattr(algorithms, name)
+                 for name in algorithms.__all__}
+
 
 def get_boundaries_module(boundaries_id):
     """Obtains the boundaries module given a boundary algorithm identificator.
@@ -34,8 +38,8 @@ def get_boundaries_module(boundaries_id):
     if boundaries_id == "gt":
         return None
     try:
-        module = eval(algorithms.__name__ + "." + boundaries_id)
-    except AttributeError:
+        module = _ALGO_MODULES[boundaries_id]
+    except KeyError:
         raise RuntimeError("Algorithm %s can not be found in msaf!" %
                            boundaries_id)
     if not module.is_boundary_type:
@@ -61,8 +65,8 @@ def get_labels_module(labels_id):
     if labels_id is None:
         return None
     try:
-        module = eval(algorithms.__name__ + "." + labels_id)
-    except AttributeError:
+        module = _ALGO_MODULES[labels_id]
+    except KeyError:
         raise RuntimeError("Algorithm %s can not be found in msaf!" %
                            labels_id)
     if not module.is_label_type:
@@ -89,12 +93,15 @@ def run_hierarchical(audio_file, bounds_module, labels_module, frame_times,
     est_idxs, est_labels = S.processHierarchical()
 
     # Compute labels if needed
-    if labels_module is not None and \
-            bounds_module.__name__ != labels_module.__name__:
-        # Compute labels for each level in the hierarchy
-        flat_config = deepcopy(config)
-        flat_config["hier"] = False
+    if labels_module is not None and labels_module is not bounds_module:
+        # Compute labels for each level in the hierarchy (shallow copy, to
+        # avoid duplicating the features)
+        flat_config = dict(config, hier=False)
         for i, level_idxs in enumerate(est_idxs):
+            # A single segment needs no labeling algorithm
+            if len(level_idxs) == 2:
+                est_labels[i] = np.array([0])
+                continue
             S = labels_module.Segmenter(audio_file,
                                         in_bound_idxs=level_idxs,
                                         **flat_config)
@@ -102,13 +109,14 @@ def run_hierarchical(audio_file, bounds_module, labels_module, frame_times,
 
     # Make sure the first and last boundaries are included for each
     # level in the hierarchy
+    n_frames = features.shape[0]
+    dur = config["features"].dur
     est_times = []
     cleaned_est_labels = []
-    for level in range(len(est_idxs)):
+    for level_idxs, level_labels in zip(est_idxs, est_labels):
         est_level_times, est_level_labels = \
             utils.process_segmentation_level(
-                est_idxs[level], est_labels[level], features.shape[0],
-                frame_times, config["features"].dur)
+                level_idxs, level_labels, n_frames, frame_times, dur)
         est_times.append(est_level_times)
         cleaned_est_labels.append(est_level_labels)
     est_labels = cleaned_est_labels
@@ -126,8 +134,7 @@ def run_flat(file_struct, bounds_module, labels_module, frame_times, config,
 
     # Segment using the specified boundaries and labels
     # Case when boundaries and labels algorithms are the same
-    if bounds_module is not None and labels_module is not None and \
-            bounds_module.__name__ == labels_module.__name__:
+    if bounds_module is not None and bounds_module is labels_module:
         S = bounds_module.Segmenter(file_struct, **config)
         est_idxs, est_labels = S.processFlat()
     # Different boundary and label algorithms
@@ -209,10 +216,13 @@ def run_algorithms(file_struct, boundaries_id, labels_id, config,
     # Get the correct frame times
     frame_times = config["features"].frame_times
 
-    # Segment audio based on type of segmentation
+    # Segment audio based on type of segmentation, seeding random for each
+    # track to reproduce results regardless of the process that runs it
     run_fun = run_hierarchical if config["hier"] else run_flat
-    est_times, est_labels = run_fun(file_struct, bounds_module, labels_module,
-                                    frame_times, config, annotator_id)
+    with utils.random_seed(123):
+        est_times, est_labels = run_fun(file_struct, bounds_module,
+                                        labels_module, frame_times, config,
+                                        annotator_id)
 
     return est_times, est_labels
 
@@ -262,6 +272,38 @@ def process_track(file_struct, boundaries_id, labels_id, config,
     return est_times, est_labels
 
 
+def load_audio(in_path, sr):
+    """Loads a mono audio signal, reading it with soundfile when possible and
+    resampling it only if the native sampling rate differs from `sr`.
+
+    Parameters
+    ----------
+    in_path: str
+        Path to the audio file.
+    sr: int > 0
+        Target sampling rate.
+
+    Returns
+    -------
+    audio: np.array
+        Mono audio signal.
+    sr: int > 0
+        Sampling rate of the audio signal.
+    """
+    try:
+        import soundfile as sf
+        audio, native_sr = sf.read(in_path, dtype="float32")
+    except (ImportError, RuntimeError):
+        # Format not supported by libsndfile, use the slower librosa path
+        audio, native_sr = librosa.load(in_path, sr=None)
+
+    if audio.ndim > 1:
+        audio = librosa.to_mono(audio.T)
+    if native_sr != sr:
+        audio = librosa.resample(audio, orig_sr=native_sr, target_sr=sr)
+    return audio, sr
+
+
 def process(in_path, annot_beats=False, feature="pcp", framesync=False,
             boundaries_id=msaf.config.default_bound_id,
             labels_id=msaf.config.default_label_id, hier=False,
@@ -312,8 +354,9 @@ def process(in_path, annot_beats=False, feature="pcp", framesync=False,
         boundary times and estimated labels.
         If labels_id is None, est_labels will be a list of -1.
     """
-    # Seed random to reproduce results
-    np.random.seed(123)
+    # Make sure the algorithms exist before processing any file
+    get_boundaries_module(boundaries_id)
+    get_labels_module(labels_id)
 
     # Set up configuration based on algorithms parameters
     if config is None:
@@ -338,14 +381,19 @@ def process(in_path, annot_beats=False, feature="pcp", framesync=False,
         config["features"] = Features.select_features(
             feature, file_struct, annot_beats, framesync)
 
-        # And run the algorithms
-        est_times, est_labels = run_algorithms(file_struct, boundaries_id,
-                                               labels_id, config,
-                                               annotator_id=annotator_id)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Load the audio to sonify while the algorithms are running
+            if sonify_bounds:
+                future_audio = executor.submit(load_audio, in_path, out_sr)
+
+            # And run the algorithms
+            est_times, est_labels = run_algorithms(file_struct, boundaries_id,
+                                                   labels_id, config,
+                                                   annotator_id=annotator_id)
 
         if sonify_bounds:
             logging.info("Sonifying boundaries in %s..." % out_bounds)
-            audio_hq, sr = librosa.load(in_path, sr=out_sr)
+            audio_hq, sr = future_audio.result()
             utils.sonify_clicks(audio_hq, est_times, out_bounds, out_sr)
 
         if plot:
@@ -363,6 +411,19 @@ def process(in_path, annot_beats=False, feature="pcp", framesync=False,
         # Collection mode
         file_structs = io.get_dataset_files(in_path)
 
-        return Parallel(n_jobs=n_jobs)(delayed(process_track)(
-            file_struct, boundaries_id, labels_id, config,
-            annotator_id=annotator_id) for file_struct in file_structs[:])
+        # Features are computed per track, so don't send them to the workers
+        config["features"] = None
+
+        # Process the largest files first (file size being a proxy for
+        # duration), so that long tracks don't delay the end of the run
+        sizes = [os.path.getsize(file_struct.audio_file)
+                 for file_struct in file_structs]
+        order = sorted(range(len(file_structs)), key=lambda i: -sizes[i])
+
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(process_track)(
+                file_structs[i], boundaries_id, labels_id, config,
+                annotator_id=annotator_id) for i in order)
+
+        # Return the results in the same order as the files
+        return [results[i] for i in np.argsort(order)]
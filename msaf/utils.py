@@ -1,10 +1,11 @@
 """
 Useful functions that are common in MSAF
 """
+from contextlib import contextmanager
 import librosa
-import mir_eval
 import numpy as np
 import os
+import random
 import scipy.io.wavfile
 import six
 
@@ -59,6 +60,27 @@ def ensure_dir(directory):
         os.makedirs(directory)
 
 
+@contextmanager
+def random_seed(seed):
+    """Seeds the global random generators (both NumPy's and Python's) within
+    a `with` block, restoring their previous states when leaving it.
+
+    Parameters
+    ----------
+    seed: int
+        Seed for the random generators.
+    """
+    np_state = np.random.get_state()
+    py_state = random.getstate()
+    np.random.seed(seed)
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        np.random.set_state(np_state)
+        random.setstate(py_state)
+
+
 def times_to_intervals(times):
     """Given a set of times, convert them into intervals.
 
@@ -107,14 +129,11 @@ def get_time_frames(dur, anal):
 def remove_empty_segments(times, labels):
     """Removes empty segments if needed."""
     assert len(times) - 1 == len(labels)
-    inters = times_to_intervals(times)
-    new_inters = []
-    new_labels = []
-    for inter, label in zip(inters, labels):
-        if inter[0] < inter[1]:
-            new_inters.append(inter)
-            new_labels.append(label)
-    return intervals_to_times(np.asarray(new_inters)), new_labels
+    times = np.asarray(times)
+    keep = times[:-1] < times[1:]
+    new_times = np.concatenate((times[:-1][keep], times[1:][keep][-1:]))
+    new_labels = [labels[i] for i in np.flatnonzero(keep)]
+    return new_times, new_labels
 
 
 def sonify_clicks(audio, clicks, out_file, fs, offset=0):
@@ -133,15 +152,17 @@ def sonify_clicks(audio, clicks, out_file, fs, offset=0):
     offset: float
         Offset of the clicks with respect to the audio.
     """
-    # Generate clicks (this should be done by mir_eval, but its
-    # latest release is not compatible with latest numpy)
-    times = clicks + offset
+    # Generate clicks (same as mir_eval.sonify.clicks, but placing all of
+    # them at once instead of looping over the times)
+    times = np.asarray(clicks) + offset
     # 1 kHz tone, 100ms
     click = np.sin(2 * np.pi * np.arange(fs * .1) * 1000 / (1. * fs))
     # Exponential decay
     click *= np.exp(-np.arange(fs * .1) / (fs * .01))
     length = int(times.max() * fs + click.shape[0] + 1)
-    audio_clicks = mir_eval.sonify.clicks(times, fs, length=length)
+    starts = (times * fs).astype(int)
+    audio_clicks = np.zeros(length)
+    audio_clicks[starts[:, np.newaxis] + np.arange(click.shape[0])] = click
 
     # Create array to store the audio plus the clicks
     out_audio = np.zeros(max(len(audio), len(audio_clicks)))
@@ -42,7 +42,7 @@ setup(
         'enum34',
         'future',
         'jams >= 0.3.0',
-        'joblib',
+        'joblib >= 0.12',
         'librosa >= 0.6.0',
         'mir_eval',
         'matplotlib >= 1.5',
@@ -149,6 +149,73 @@ def test_change_local_cqt_paramaters():
     assert("ann_beatsync" in data[CQT.get_id()].keys())
 
 
+def test_reuse_cached_beats():
+    """The beats stored in the features file should be reused when computing
+    other features of the same audio file."""
+    my_file_struct = FileStruct(audio_file)
+    my_file_struct.ref_file = os.path.join("fixtures", "chirp.jams")
+    my_file_struct.features_file = os.path.join("features", "beats.json")
+    feat_type = FeatureTypes.est_beatsync
+    pcp = PCP(my_file_struct, feat_type, sr=11025)
+    pcp.features
+
+    def _fail():
+        raise AssertionError("Beats should have been read from the file")
+
+    # New features, but same audio and global parameters
+    mfcc = MFCC(my_file_struct, feat_type, sr=11025)
+    mfcc.estimate_beats = _fail
+    mfcc.read_ann_beats = _fail
+    mfcc.features
+    assert np.array_equal(mfcc._est_beats_times, pcp._est_beats_times)
+    assert np.array_equal(mfcc._ann_beats_times, pcp._ann_beats_times)
+    assert np.array_equal(mfcc._ann_beats_frames, pcp._ann_beats_frames)
+
+    # Beats can't be reused with different global parameters
+    mfcc = MFCC(my_file_struct, feat_type, sr=22050)
+    mfcc.dur = pcp.dur
+    assert mfcc.read_cached_beats() == (None, None)
+    os.remove(my_file_struct.features_file)
+
+
+def test_reuse_cached_beats_frames():
+    """Reusing the beats stored in the features file should yield the same
+    frames and beat-synchronous features as computing them from scratch."""
+    audio = os.path.join("fixtures", "Sargon_test", "audio", "Mindless_cut.mp3")
+    feat_type = FeatureTypes.est_beatsync
+    my_file_struct = FileStruct(audio)
+    my_file_struct.features_file = os.path.join("features", "beats.json")
+    PCP(my_file_struct, feat_type).features
+    mfcc = MFCC(my_file_struct, feat_type)
+    mfcc.features
+
+    fresh_file_struct = FileStruct(audio)
+    fresh_file_struct.features_file = os.path.join("features", "fresh.json")
+    fresh = MFCC(fresh_file_struct, feat_type)
+    fresh.features
+    assert np.array_equal(mfcc._est_beats_frames, fresh._est_beats_frames)
+    assert np.array_equal(mfcc._est_beatsync_features,
+                          fresh._est_beatsync_features)
+    os.remove(my_file_struct.features_file)
+    os.remove(fresh_file_struct.features_file)
+
+
+def test_features_decimals():
+    """Stored features should be rounded if features_decimals is set."""
+    my_file_struct = FileStruct(audio_file)
+    my_file_struct.features_file = os.path.join("features", "rounded.json")
+    msaf.config.features_decimals = 2
+    try:
+        PCP(my_file_struct, FeatureTypes.framesync, sr=11025).features
+    finally:
+        msaf.config.features_decimals = None
+    with open(my_file_struct.features_file) as f:
+        data = json.load(f)
+    os.remove(my_file_struct.features_file)
+    framesync = np.array(data[PCP.get_id()]["framesync"])
+    assert np.allclose(framesync, np.round(framesync, 2))
+
+
 def test_change_global_paramaters():
     """The features should be correctly updated if global parameters
     updated."""
@@ -274,6 +341,10 @@ def test_frame_times_framesync():
     pcp = PCP(my_file_struct, FeatureTypes.framesync, sr=11025)
     times = pcp.frame_times
     assert(isinstance(times, np.ndarray))
+    assert(times.shape[0] == pcp.features.shape[0])
+
+    # Frame times should only be computed once
+    assert(pcp.frame_times is times)
 
 
 def test_frame_times_no_annotations():
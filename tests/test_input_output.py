@@ -5,6 +5,7 @@
 # nosetests
 
 import jams
+import json
 import librosa
 from pytest import raises
 import numpy as np
@@ -134,6 +135,34 @@ def test_save_estimations_existing():
     os.remove(est_file)
 
 
+def test_read_features_file():
+    features_file = "tmp_features.json"
+    shutil.copy(os.path.join("fixtures", "01_-_Come_Together.json"),
+                features_file)
+
+    # Second read should reuse the parsed contents
+    feats = msaf.io.read_features_file(features_file)
+    assert msaf.io.read_features_file(features_file) is feats
+    dur = msaf.io.get_duration(features_file)
+    assert dur == float(feats["globals"]["dur"])
+
+    # Modifying the file should invalidate the cached contents
+    modified_feats = dict(feats)
+    modified_feats["globals"] = dict(feats["globals"], dur=dur + 1)
+    with open(features_file, "w") as f:
+        json.dump(modified_feats, f)
+    new_feats = msaf.io.read_features_file(features_file)
+    assert new_feats is not feats
+    assert msaf.io.get_duration(features_file) == dur + 1
+
+    # Cleanup
+    os.remove(features_file)
+
+    # Missing files should still raise an error
+    with raises(IOError):
+        msaf.io.read_features_file(features_file)
+
+
 def test_write_mirex():
     times = np.array([0, 10, 20, 30])
     labels = np.array([0, 1, 2])
@@ -161,3 +190,8 @@ def test_align_times():
     frames = np.array([0, 12, 19, 25, 31])
     aligned_times = msaf.io.align_times(times, frames)
     assert len(times) == len(aligned_times)
+    assert list(aligned_times) == [0, 1, 3, 4]
+
+    # Times past the last frame go to the last frame
+    aligned_times = msaf.io.align_times(np.array([0, 40]), frames)
+    assert list(aligned_times) == [0, 4]
@@ -12,6 +12,7 @@ matplotlib.rcParams.update(matplotlib.rcParamsDefault)
 import matplotlib.style
 matplotlib.style.use('seaborn-ticks')
 
+import librosa
 from pytest import raises
 import numpy.testing as npt
 import os
@@ -205,6 +206,15 @@ def test_process_wrong_feature():
         est_times, est_labels = msaf.run.process(long_audio_file, feature=feature)
 
 
+def test_process_wrong_algorithm():
+    with raises(RuntimeError):
+        est_times, est_labels = msaf.run.process(long_audio_file,
+                                                 boundaries_id="caca")
+    with raises(RuntimeError):
+        est_times, est_labels = msaf.run.process(long_audio_file,
+                                                 labels_id="foote")
+
+
 def test_process_wrong_path():
     wrong_path = "caca.mp3"
     with raises(NoAudioFileError):
@@ -217,6 +227,16 @@ def test_process():
     assert len(est_times) == len(est_labels) + 1
 
 
+def test_load_audio():
+    sr = 11025
+    audio, out_sr = msaf.run.load_audio(audio_file, sr)
+    assert out_sr == sr
+    assert audio.ndim == 1
+    ref_audio, _ = librosa.load(audio_file, sr=sr)
+    npt.assert_almost_equal(len(audio) / float(sr),
+                            len(ref_audio) / float(sr), decimal=2)
+
+
 def test_process_sonify():
     out_wav = "out_wav.wav"
     est_times, est_labels = msaf.run.process(long_audio_file,
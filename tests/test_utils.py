@@ -3,8 +3,10 @@
 # nosetests -v -s test_utils.py
 import copy
 import librosa
+import mir_eval
 import numpy as np
 import os
+import scipy.io.wavfile
 
 # Msaf imports
 import msaf
@@ -45,6 +47,42 @@ def test_get_time_frames():
     assert n_frames[-1] == 1.0
 
 
+def test_remove_empty_segments():
+    times = [0, 10, 10, 20, 30, 30]
+    labels = [0, 1, 2, 3, 4]
+    new_times, new_labels = msaf.utils.remove_empty_segments(times, labels)
+    assert list(new_times) == [0, 10, 20, 30]
+    assert new_labels == [0, 2, 3]
+
+
+def test_sonify_clicks():
+    out_file = "out_clicks.wav"
+    clicks = np.array([0.5, 2.25, 4.0, 4.05, 9.75])
+    msaf.utils.sonify_clicks(audio, clicks, out_file, fs)
+    out_fs, out_audio = scipy.io.wavfile.read(out_file)
+    os.remove(out_file)
+
+    assert out_fs == fs
+    ref_clicks = mir_eval.sonify.clicks(clicks, fs)
+    expected = np.zeros(max(len(audio), len(ref_clicks)))
+    expected[:len(audio)] = audio
+    expected[:len(ref_clicks)] += ref_clicks
+    assert np.allclose(out_audio, expected)
+
+
+def test_random_seed():
+    np.random.seed(0)
+    state = np.random.get_state()[1].copy()
+    with msaf.utils.random_seed(123):
+        first = np.random.random(5)
+    with msaf.utils.random_seed(123):
+        second = np.random.random(5)
+    assert np.array_equal(first, second)
+
+    # The previous state must be restored
+    assert np.array_equal(np.random.get_state()[1], state)
+
+
 def test_align_end_hierarchies():
     def _test_equal_hier(hier_orig, hier_new):
         for layer_orig, layer_new in zip(hier_orig, hier_new):